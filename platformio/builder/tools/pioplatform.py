@@ -14,6 +14,7 @@
 
 from __future__ import absolute_import
 
+import re
 import sys
 from os.path import isdir, isfile, join
 
@@ -27,6 +28,24 @@ from platformio.project.config import ProjectOptions
 
 # pylint: disable=too-many-branches, too-many-locals
 
+RE_NON_DIGITS = re.compile(r"\D")
+
+_BOARD_CONFIGS_CACHE = {}
+
+# build variables with a default value in a board manifest -> data path
+BOARD_BUILDENVVARS = [
+    (
+        option_meta.buildenvvar,
+        (
+            option_meta.name[6:]
+            if option_meta.name.startswith("board_")
+            else option_meta.name.replace("_", ".")
+        ),
+    )
+    for option_meta in ProjectOptions.values()
+    if option_meta.buildenvvar
+]
+
 
 @util.memoized()
 def PioPlatform(env):
@@ -40,12 +59,16 @@ def PioPlatform(env):
 
 
 def BoardConfig(env, board=None):
+    board = board or env.get("BOARD")
+    cache_key = (env.get("PLATFORM_MANIFEST"), board)
+    if board and cache_key in _BOARD_CONFIGS_CACHE:
+        return _BOARD_CONFIGS_CACHE[cache_key]
     with fs.cd(env.subst("$PROJECT_DIR")):
         try:
             p = env.PioPlatform()
-            board = board or env.get("BOARD")
             assert board, "BoardConfig: Board is not defined"
-            return p.board_config(board)
+            _BOARD_CONFIGS_CACHE[cache_key] = p.board_config(board)
+            return _BOARD_CONFIGS_CACHE[cache_key]
         except (AssertionError, exception.UnknownBoard) as e:
             sys.stderr.write("Error: %s\n" % str(e))
             env.Exit(1)
@@ -62,21 +85,21 @@ def GetFrameworkScript(env, framework):
 
 def LoadPioPlatform(env):
     p = env.PioPlatform()
-    installed_packages = p.get_installed_packages()
 
     # Ensure real platform name
     env["PIOPLATFORM"] = p.name
 
     # Add toolchains and uploaders to $PATH and $*_LIBRARY_PATH
     systype = util.get_systype()
-    for name in installed_packages:
+    for name in p.packages:
         type_ = p.get_package_type(name)
         if type_ not in ("toolchain", "uploader", "debugger"):
             continue
         pkg_dir = p.get_package_dir(name)
-        env.PrependENVPath(
-            "PATH", join(pkg_dir, "bin") if isdir(join(pkg_dir, "bin")) else pkg_dir
-        )
+        if not pkg_dir:
+            continue
+        bin_dir = join(pkg_dir, "bin")
+        env.PrependENVPath("PATH", bin_dir if isdir(bin_dir) else pkg_dir)
         if not WINDOWS and isdir(join(pkg_dir, "lib")) and type_ != "toolchain":
             env.PrependENVPath(
                 "DYLD_LIBRARY_PATH" if "darwin" in systype else "LD_LIBRARY_PATH",
@@ -106,16 +129,11 @@ def LoadPioPlatform(env):
         board_config.update(option, value)
 
     # load default variables from board config
-    for option_meta in ProjectOptions.values():
-        if not option_meta.buildenvvar or option_meta.buildenvvar in env:
+    for buildenvvar, data_path in BOARD_BUILDENVVARS:
+        if buildenvvar in env:
             continue
-        data_path = (
-            option_meta.name[6:]
-            if option_meta.name.startswith("board_")
-            else option_meta.name.replace("_", ".")
-        )
         try:
-            env[option_meta.buildenvvar] = board_config.get(data_path)
+            env[buildenvvar] = board_config.get(data_path)
         except KeyError:
             pass
 
@@ -153,17 +171,18 @@ def PrintConfiguration(env):  # pylint: disable=too-many-statements
 
     def _get_hardware_data():
         data = ["HARDWARE:"]
-        mcu = env.subst("$BOARD_MCU")
-        f_cpu = env.subst("$BOARD_F_CPU")
+        mcu = env.get("BOARD_MCU")
+        f_cpu = env.get("BOARD_F_CPU")
         if mcu:
             data.append(mcu.upper())
         if f_cpu:
-            f_cpu = int("".join([c for c in str(f_cpu) if c.isdigit()]))
-            data.append("%dMHz," % (f_cpu / 1000000))
+            f_cpu = int(RE_NON_DIGITS.sub("", str(f_cpu)))
+            data.append("%dMHz," % (f_cpu // 1000000))
         if not board_config:
             return data
-        ram = board_config.get("upload", {}).get("maximum_ram_size")
-        flash = board_config.get("upload", {}).get("maximum_size")
+        upload = board_config.get("upload", {})
+        ram = upload.get("maximum_ram_size")
+        flash = upload.get("maximum_size")
         data.append(
             "%s RAM, %s Flash" % (fs.format_filesize(ram), fs.format_filesize(flash))
         )
@@ -181,17 +200,13 @@ def PrintConfiguration(env):  # pylint: disable=too-many-statements
             "(%s)"
             % board_config.get_debug_tool_name(env.GetProjectOption("debug_tool")),
         ]
-        onboard = []
-        external = []
-        for key, value in debug_tools.items():
-            if value.get("onboard"):
-                onboard.append(key)
-            else:
-                external.append(key)
+        items = sorted(debug_tools.items())
+        onboard = [key for key, value in items if value.get("onboard")]
+        external = [key for key, value in items if not value.get("onboard")]
         if onboard:
-            data.extend(["On-board", "(%s)" % ", ".join(sorted(onboard))])
+            data.extend(["On-board", "(%s)" % ", ".join(onboard)])
         if external:
-            data.extend(["External", "(%s)" % ", ".join(sorted(external))])
+            data.extend(["External", "(%s)" % ", ".join(external)])
         return data
 
     def _get_packages_data():
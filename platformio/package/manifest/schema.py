@@ -12,12 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import os
+import re
+
 import requests
-import semantic_version
 from marshmallow import Schema, ValidationError, fields, validate, validates
 
+from platformio import fs
+from platformio.app import ContentCache
 from platformio.package.exception import ManifestValidationError
-from platformio.util import memoized
+from platformio.util import get_request_defheaders, memoized
+
+RE_EXAMPLE_NAME = re.compile(r"^[a-zA-Z\d\-\_/]+$")
+RE_KEYWORD = re.compile(r"^[a-z\d\-\+\. ]+$")
+RE_PLATFORM = re.compile(r"^([a-z\d\-_]+|\*)$")
+RE_SYSTEM = re.compile(r"^[a-z\d\-_]+$")
 
 
 class StrictSchema(Schema):
@@ -45,7 +55,7 @@ class StrictListField(fields.List):
 class AuthorSchema(StrictSchema):
     name = fields.Str(required=True, validate=validate.Length(min=1, max=50))
     email = fields.Email(validate=validate.Length(min=1, max=50))
-    maintainer = fields.Bool(default=False)
+    maintainer = fields.Bool()
     url = fields.Url(validate=validate.Length(min=1, max=255))
 
 
@@ -72,7 +82,7 @@ class ExampleSchema(StrictSchema):
         validate=[
             validate.Length(min=1, max=100),
             validate.Regexp(
-                r"^[a-zA-Z\d\-\_/]+$", error="Only [a-zA-Z0-9-_/] chars are allowed"
+                RE_EXAMPLE_NAME, error="Only [a-zA-Z0-9-_/] chars are allowed"
             ),
         ],
     )
@@ -100,7 +110,7 @@ class ManifestSchema(Schema):
             validate=[
                 validate.Length(min=1, max=50),
                 validate.Regexp(
-                    r"^[a-z\d\-\+\. ]+$", error="Only [a-z0-9-+. ] chars are allowed"
+                    RE_KEYWORD, error="Only [a-z0-9-+. ] chars are allowed"
                 ),
             ]
         )
@@ -111,7 +121,7 @@ class ManifestSchema(Schema):
             validate=[
                 validate.Length(min=1, max=50),
                 validate.Regexp(
-                    r"^([a-z\d\-_]+|\*)$", error="Only [a-z0-9-_*] chars are allowed"
+                    RE_PLATFORM, error="Only [a-z0-9-_*] chars are allowed"
                 ),
             ]
         )
@@ -121,7 +131,7 @@ class ManifestSchema(Schema):
             validate=[
                 validate.Length(min=1, max=50),
                 validate.Regexp(
-                    r"^([a-z\d\-_]+|\*)$", error="Only [a-z0-9-_*] chars are allowed"
+                    RE_PLATFORM, error="Only [a-z0-9-_*] chars are allowed"
                 ),
             ]
         )
@@ -135,9 +145,7 @@ class ManifestSchema(Schema):
         fields.Str(
             validate=[
                 validate.Length(min=1, max=50),
-                validate.Regexp(
-                    r"^[a-z\d\-_]+$", error="Only [a-z0-9-_] chars are allowed"
-                ),
+                validate.Regexp(RE_SYSTEM, error="Only [a-z0-9-_] chars are allowed"),
             ]
         )
     )
@@ -148,24 +156,20 @@ class ManifestSchema(Schema):
 
     @validates("version")
     def validate_version(self, value):  # pylint: disable=no-self-use
+        import semantic_version  # pylint: disable=import-outside-toplevel
+
+        error = "Invalid semantic versioning format, see https://semver.org/"
+        if "." not in value:
+            raise ValidationError(error)
         try:
-            value = str(value)
-            assert "." in value
             semantic_version.Version.coerce(value)
-        except (AssertionError, ValueError):
-            raise ValidationError(
-                "Invalid semantic versioning format, see https://semver.org/"
-            )
+        except ValueError:
+            raise ValidationError(error)
 
     @validates("license")
     def validate_license(self, value):
-        try:
-            spdx = self.load_spdx_licenses()
-        except requests.exceptions.RequestException:
-            raise ValidationError("Could not load SPDX licenses for validation")
-        for item in spdx.get("licenses", []):
-            if item.get("licenseId") == value:
-                return
+        if value in self.load_spdx_license_ids():
+            return
         raise ValidationError(
             "Invalid SPDX license identifier. See valid identifiers at "
             "https://spdx.org/licenses/"
@@ -174,9 +178,62 @@ class ManifestSchema(Schema):
     @staticmethod
     @memoized(expire="1h")
     def load_spdx_licenses():
-        r = requests.get(
+        spdx_url = (
             "https://raw.githubusercontent.com/spdx/license-list-data"
             "/v3.6/json/licenses.json"
         )
-        r.raise_for_status()
-        return r.json()
+        cache_key = ContentCache.key_from_args(spdx_url)
+        try:
+            with ContentCache() as cc:
+                result = cc.get(cache_key)
+            if result:
+                return json.loads(result)
+        except (IOError, OSError, ValueError):
+            pass  # unreadable or corrupted cache, fetch a fresh copy
+        try:
+            r = _spdx_request_session().get(
+                spdx_url, headers=get_request_defheaders(), timeout=10
+            )
+            r.raise_for_status()
+            data = r.json()
+        except (requests.exceptions.RequestException, ValueError):
+            # fall back to the bundled copy of the same list version
+            return fs.load_json(
+                os.path.join(os.path.dirname(__file__), "spdx_licenses.json")
+            )
+        try:
+            with ContentCache() as cc:
+                cc.set(cache_key, r.text, "1d")
+        except (IOError, OSError):
+            pass
+        return data
+
+    @staticmethod
+    @memoized(expire="1h")
+    def load_spdx_license_ids():
+        spdx = ManifestSchema.load_spdx_licenses()
+        return frozenset(
+            item["licenseId"]
+            for item in spdx.get("licenses", [])
+            if item.get("licenseId")
+        )
+
+
+@memoized()
+def _spdx_request_session():
+    # process-wide, keeps the connection for re-fetches after the caches expire
+    session = requests.Session()
+    session.mount(
+        "https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1)
+    )
+    return session
+
+
+def get_manifest_schema(strict=False, many=False):
+    """Returns shared ManifestSchema instance. Do not modify its attributes."""
+    return _get_manifest_schema(bool(strict), bool(many))
+
+
+@memoized()
+def _get_manifest_schema(strict, many):
+    return ManifestSchema(strict=strict, many=many)
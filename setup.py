@@ -56,6 +56,7 @@ setup(
             "ide/tpls/*/*.tpl",
             "ide/tpls/*/*/*.tpl",
             "ide/tpls/*/.*/*.tpl",
+            "package/manifest/spdx_licenses.json",
         ],
         "scripts": ["99-platformio-udev.rules"],
     },
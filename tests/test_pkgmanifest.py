@@ -17,10 +17,37 @@ import re
 
 import jsondiff
 import pytest
+import requests
 
 from platformio.compat import WINDOWS
 from platformio.package.manifest import parser
-from platformio.package.manifest.schema import ManifestSchema, ManifestValidationError
+from platformio.package.manifest.schema import (
+    ManifestSchema,
+    ManifestValidationError,
+    get_manifest_schema,
+)
+
+
+@pytest.fixture(scope="function")
+def spdx_licenses_cache(monkeypatch, tmpdir, isolated_pio_home):
+    monkeypatch.setenv("PLATFORMIO_CACHE_DIR", str(tmpdir))
+    ManifestSchema.load_spdx_licenses.reset()
+    ManifestSchema.load_spdx_license_ids.reset()
+    yield tmpdir
+    ManifestSchema.load_spdx_licenses.reset()
+    ManifestSchema.load_spdx_license_ids.reset()
+
+
+def mock_spdx_response(monkeypatch, content=None):
+    def _get(*_, **__):
+        if content is None:
+            raise requests.exceptions.ConnectionError("offline")
+        r = requests.Response()
+        r.status_code = 200
+        r._content = content  # pylint: disable=protected-access
+        return r
+
+    monkeypatch.setattr(requests.Session, "get", _get)
 
 
 def test_library_json_parser():
@@ -631,6 +658,16 @@ def test_broken_schemas():
     assert errors
     assert data["keywords"] == ["kw1"]
 
+    # shared schema instance
+    schema = get_manifest_schema(strict=False)
+    assert schema is get_manifest_schema(strict=False)
+    assert get_manifest_schema() is get_manifest_schema(strict=False)
+    assert get_manifest_schema(False) is get_manifest_schema(strict=False)
+    data, errors = schema.load(dict(keywords=["kw1", "*^[]"]))
+    assert errors and data["keywords"] == ["kw1"]
+    data, errors = schema.load(dict(name="MyPackage", version="1.2.3"))
+    assert not errors
+
     # strict mode
 
     with pytest.raises(
@@ -645,6 +682,10 @@ def test_broken_schemas():
         ManifestSchema(strict=True).load(
             dict(name="MyPackage", version="broken_version")
         )
+    with pytest.raises(
+        ManifestValidationError, match=("Invalid semantic versioning format")
+    ):
+        ManifestSchema(strict=True).load(dict(name="MyPackage", version="1"))
 
     # broken value for Nested
     with pytest.raises(ManifestValidationError, match=r"authors.*Invalid input type"):
@@ -657,3 +698,41 @@ def test_broken_schemas():
                 version="1.2.3",
             )
         )
+
+
+def test_spdx_licenses_fallback(monkeypatch, spdx_licenses_cache):
+    mock_spdx_response(monkeypatch)
+    data, errors = ManifestSchema(strict=True).load(
+        dict(name="MyPackage", version="1.0.0", license="MIT")
+    )
+    assert not errors
+    assert data["license"] == "MIT"
+    assert not spdx_licenses_cache.listdir()
+
+
+def test_spdx_licenses_cache(monkeypatch, spdx_licenses_cache):
+    mock_spdx_response(monkeypatch, b'{"licenses": [{"licenseId": "Custom"}]}')
+    assert "Custom" in ManifestSchema.load_spdx_license_ids()
+    assert spdx_licenses_cache.listdir()
+
+    # served from cache when the network is not available
+    ManifestSchema.load_spdx_licenses.reset()
+    ManifestSchema.load_spdx_license_ids.reset()
+    mock_spdx_response(monkeypatch)
+    assert "Custom" in ManifestSchema.load_spdx_license_ids()
+    data, errors = ManifestSchema(strict=True).load(
+        dict(name="MyPackage", version="1.0.0", license="Custom")
+    )
+    assert not errors
+
+
+def test_spdx_licenses_invalid_response(monkeypatch, spdx_licenses_cache):
+    mock_spdx_response(monkeypatch, b"<html>Captive portal</html>")
+    assert "MIT" in ManifestSchema.load_spdx_license_ids()
+    assert not spdx_licenses_cache.listdir()
+
+    # broken response was not cached
+    ManifestSchema.load_spdx_licenses.reset()
+    ManifestSchema.load_spdx_license_ids.reset()
+    mock_spdx_response(monkeypatch, b'{"licenses": [{"licenseId": "Custom"}]}')
+    assert "Custom" in ManifestSchema.load_spdx_license_ids()